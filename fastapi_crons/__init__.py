@@ -1,5 +1,6 @@
 from .scheduler import Crons
 from .job import CronJob, cron_job
+from .map_job import MapCronJob, map_cron_job
 from .endpoints import get_cron_router
 from .hooks import (
     log_job_start, log_job_success, log_job_error,
@@ -10,6 +11,7 @@ from .hooks import (
 
 __all__ = [
     "Crons", "CronJob", "cron_job", "get_cron_router",
+    "MapCronJob", "map_cron_job",
     "log_job_start", "log_job_success", "log_job_error",
     "webhook_notification", 
     "metrics_collector",
@@ -1,6 +1,9 @@
 from fastapi import APIRouter
+from pydantic import BaseModel
+from typing import List, Optional
 from .state import SQLiteStateBackend
 from .scheduler import Crons
+from .map_job import MapCronJob
 import asyncio
 from datetime import datetime
 import inspect
@@ -9,31 +12,94 @@ router = APIRouter()
 
 _crons: Crons = None
 
-async def get_all_jobs():
+class JobCreate(BaseModel):
+    name: str
+    expr: str
+    func: str
+    tags: List[str] = []
+
+class JobSchedule(BaseModel):
+    expr: str
+
+async def get_all_jobs(tag: Optional[str] = None):
     if not _crons:
         return []
-    jobs = _crons.get_jobs()
+    jobs = _crons.get_jobs_by_tag(tag) if tag else _crons.get_jobs()
     backend = _crons.state_backend
     result = []
     for job in jobs:
         last_run = await backend.get_last_run(job.name)
-        result.append({
+        info = {
             "name": job.name,
             "expr": job.expr,
             "tags": job.tags,
             "last_run": last_run,
+            "paused": job.paused,
             "next_run": job.next_run.isoformat(),
             "hooks": {
                 "before_run": len(job.before_run_hooks),
                 "after_run": len(job.after_run_hooks),
                 "on_error": len(job.on_error_hooks)
             }
-        })
+        }
+        if isinstance(job, MapCronJob):
+            info["progress"] = job.progress
+        result.append(info)
     return result
 
 @router.get("/crons")
-async def list_cron_jobs():
-    return await get_all_jobs()
+async def list_cron_jobs(tag: Optional[str] = None):
+    return await get_all_jobs(tag)
+
+@router.post("/crons")
+async def add_job(body: JobCreate):
+    if not _crons:
+        return {"error": "Scheduler not initialized"}
+
+    func = _crons.registry.funcs.get(body.func)
+    if func is None:
+        return {"status": "error", "message": f"Function '{body.func}' is not registered"}
+    try:
+        _crons.add_job(func, body.expr, name=body.name, tags=body.tags)
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}
+    return {"status": "success", "message": f"Job '{body.name}' added"}
+
+@router.delete("/crons/{job_name}")
+async def remove_job(job_name: str):
+    if not _crons:
+        return {"error": "Scheduler not initialized"}
+    if not await _crons.remove_job(job_name):
+        return {"status": "error", "message": f"Job '{job_name}' not found"}
+    return {"status": "success", "message": f"Job '{job_name}' removed"}
+
+@router.post("/crons/{job_name}/pause")
+async def pause_job(job_name: str):
+    if not _crons:
+        return {"error": "Scheduler not initialized"}
+    if not await _crons.pause_job(job_name):
+        return {"status": "error", "message": f"Job '{job_name}' not found"}
+    return {"status": "success", "message": f"Job '{job_name}' paused"}
+
+@router.post("/crons/{job_name}/resume")
+async def resume_job(job_name: str):
+    if not _crons:
+        return {"error": "Scheduler not initialized"}
+    if not await _crons.resume_job(job_name):
+        return {"status": "error", "message": f"Job '{job_name}' not found"}
+    return {"status": "success", "message": f"Job '{job_name}' resumed"}
+
+@router.put("/crons/{job_name}/schedule")
+async def reschedule_job(job_name: str, body: JobSchedule):
+    if not _crons:
+        return {"error": "Scheduler not initialized"}
+    try:
+        found = await _crons.reschedule_job(job_name, body.expr)
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}
+    if not found:
+        return {"status": "error", "message": f"Job '{job_name}' not found"}
+    return {"status": "success", "message": f"Job '{job_name}' rescheduled to '{body.expr}'"}
 
 @router.on_event("startup")
 def bind_scheduler_instance():
@@ -56,71 +122,71 @@ async def run_job(job_name: str):
     if not _crons:
         return {"error": "Scheduler not initialized"}
     
-    for job in _crons.get_jobs():
-        if job.name == job_name:
-            # Create context for hooks
-            context = {
-                "job_name": job.name,
-                "manual_trigger": True,
-                "trigger_time": datetime.now().isoformat(),
-                "tags": job.tags,
-                "expr": job.expr,
-            }
+    job = _crons.get_job(job_name)
+    if job is None:
+        return {"status": "error", "message": f"Job '{job_name}' not found"}
+
+    # Create context for hooks
+    context = {
+        "job_name": job.name,
+        "manual_trigger": True,
+        "trigger_time": datetime.now().isoformat(),
+        "tags": job.tags,
+        "expr": job.expr,
+    }
+    
+    # Execute before_run hooks
+    for hook in job.before_run_hooks:
+        await execute_hook(hook, job.name, context)
+        
+    start_time = datetime.now()
+    error = None
+    
+    try:
+        if asyncio.iscoroutinefunction(job.func):
+            result = await job.func()
+        else:
+            result = await asyncio.to_thread(job.func)
+        
+        job.last_run = datetime.now()
+        await _crons.state_backend.set_last_run(job.name, job.last_run)
+        
+        # Update context with execution details
+        context.update({
+            "success": True,
+            "start_time": start_time.isoformat(),
+            "end_time": job.last_run.isoformat(),
+            "duration": (job.last_run - start_time).total_seconds(),
+            "result": result
+        })
+        
+        # Execute after_run hooks
+        for hook in job.after_run_hooks:
+            await execute_hook(hook, job.name, context)
             
-            # Execute before_run hooks
-            for hook in job.before_run_hooks:
-                await execute_hook(hook, job.name, context)
-                
-            start_time = datetime.now()
-            error = None
+        return {
+            "status": "success", 
+            "message": f"Job '{job_name}' executed successfully",
+            "execution_time": (job.last_run - start_time).total_seconds()
+        }
+        
+    except Exception as e:
+        error = str(e)
+        
+        # Update context with error details
+        context.update({
+            "success": False,
+            "start_time": start_time.isoformat(),
+            "end_time": datetime.now().isoformat(),
+            "duration": (datetime.now() - start_time).total_seconds(),
+            "error": error
+        })
+        
+        # Execute on_error hooks
+        for hook in job.on_error_hooks:
+            await execute_hook(hook, job.name, context)
             
-            try:
-                if asyncio.iscoroutinefunction(job.func):
-                    result = await job.func()
-                else:
-                    result = await asyncio.to_thread(job.func)
-                
-                job.last_run = datetime.now()
-                await _crons.state_backend.set_last_run(job.name, job.last_run)
-                
-                # Update context with execution details
-                context.update({
-                    "success": True,
-                    "start_time": start_time.isoformat(),
-                    "end_time": job.last_run.isoformat(),
-                    "duration": (job.last_run - start_time).total_seconds(),
-                    "result": result
-                })
-                
-                # Execute after_run hooks
-                for hook in job.after_run_hooks:
-                    await execute_hook(hook, job.name, context)
-                    
-                return {
-                    "status": "success", 
-                    "message": f"Job '{job_name}' executed successfully",
-                    "execution_time": (job.last_run - start_time).total_seconds()
-                }
-                
-            except Exception as e:
-                error = str(e)
-                
-                # Update context with error details
-                context.update({
-                    "success": False,
-                    "start_time": start_time.isoformat(),
-                    "end_time": datetime.now().isoformat(),
-                    "duration": (datetime.now() - start_time).total_seconds(),
-                    "error": error
-                })
-                
-                # Execute on_error hooks
-                for hook in job.on_error_hooks:
-                    await execute_hook(hook, job.name, context)
-                    
-                return {"status": "error", "message": error}
-    
-    return {"status": "error", "message": f"Job '{job_name}' not found"}
+        return {"status": "error", "message": error}
 
 def get_cron_router():
     return router
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Callable, Optional, List, Any, Union, Awaitable
 from datetime import datetime
 from croniter import croniter
@@ -17,6 +18,11 @@ class CronJob:
         self._cron_iter = croniter(expr, datetime.now())
         self.last_run: Optional[datetime] = None
         self.next_run: datetime = self._cron_iter.get_next(datetime)
+        self.paused = False
+        self.removed = False
+        # Set whenever the schedule changes, to wake up the job's scheduling loop.
+        # The scheduler replaces it with a fresh Event each time it starts the loop.
+        self._changed = asyncio.Event()
         
         # Hooks for job execution
         self.before_run_hooks: List[HookFunc] = []
@@ -25,6 +31,32 @@ class CronJob:
 
     def update_next_run(self):
         self.next_run = self._cron_iter.get_next(datetime)
+
+    def reschedule(self, expr: str):
+        """Change the cron expression. The next run is computed from now."""
+        cron_iter = croniter(expr, datetime.now())
+        self.expr = expr
+        self._cron_iter = cron_iter
+        self.next_run = cron_iter.get_next(datetime)
+        self._changed.set()
+        return self  # For method chaining
+
+    def pause(self):
+        """Stop scheduling the job until it is resumed."""
+        self.paused = True
+        self._changed.set()
+        return self  # For method chaining
+
+    def resume(self):
+        """Resume a paused job. Runs missed while paused are skipped."""
+        self.paused = False
+        return self.reschedule(self.expr)
+
+    def stop(self):
+        """Stop the scheduling loop. A run in progress is allowed to finish."""
+        self.removed = True
+        self._changed.set()
+        return self  # For method chaining
         
     def add_before_run_hook(self, hook: HookFunc):
         """Add a hook to be executed before the job runs."""
@@ -48,8 +80,7 @@ def cron_job(expr: str, *, name=None, tags=None):
     def wrapper(func: Callable):
         # Get or create the global Crons instance
         crons = Crons()
-        job = CronJob(func, expr, name=name, tags=tags)
-        crons.jobs.append(job)
+        crons.add_job(func, expr, name=name, tags=tags)
         return func
     
     return wrapper
@@ -0,0 +1,235 @@
+import asyncio
+import inspect
+from collections import deque
+from concurrent.futures import Executor
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Optional, List, Any, Iterable, Iterator, Union, Awaitable, Tuple
+from .job import CronJob, HookFunc
+from .runner import execute_hook
+
+# Type for partition functions - can be sync or async
+PartitionFunc = Union[
+    Callable[[], Iterable[Any]],  # Sync partition
+    Callable[[], Awaitable[Iterable[Any]]]  # Async partition
+]
+
+class MapCronJob(CronJob):
+    """
+    A cron job that fans out partitioned work into parallel chunks.
+
+    On each run, `partition` produces the work items, which are split into
+    chunks of `chunk_size`. `chunk_func` is called once per chunk (with the list
+    of items) by `max_concurrency` workers, which pull chunks from the partition
+    as they go, so a generator is never loaded fully into memory. Async chunk
+    functions run on the event loop, sync ones run in `executor` (or the
+    default thread pool when no executor is given).
+
+    A failed chunk is retried up to `max_retries` times on its own, after
+    `retry_delay` seconds during which its worker moves on to other chunks.
+    The job only fails once every chunk has finished and at least one is
+    still failing.
+    """
+
+    def __init__(
+        self,
+        chunk_func: Callable,
+        expr: str,
+        partition: PartitionFunc,
+        name: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        chunk_size: int = 100,
+        max_concurrency: int = 4,
+        executor: Optional[Executor] = None,
+        max_retries: int = 0,
+        retry_delay: float = 0,
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+        if retry_delay < 0:
+            raise ValueError("retry_delay must not be negative")
+
+        super().__init__(chunk_func, expr, name=name or chunk_func.__name__, tags=tags)
+        # The scheduler calls `func()` with no arguments, so it runs the whole map
+        self.func = self.run_map
+        self.chunk_func = chunk_func
+        self.partition = partition
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
+        self.executor = executor
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+
+        # Hooks executed after each chunk attempt
+        self.on_chunk_hooks: List[HookFunc] = []
+        self.progress: dict = {}
+
+    def add_on_chunk_hook(self, hook: HookFunc):
+        """Add a hook to be executed after each chunk attempt."""
+        self.on_chunk_hooks.append(hook)
+        return self  # For method chaining
+
+    async def _get_partition(self) -> Iterator[Any]:
+        if inspect.iscoroutinefunction(self.partition):
+            items = await self.partition()
+        else:
+            items = await asyncio.to_thread(self.partition)
+        return iter(items)
+
+    async def _call_chunk(self, chunk: List[Any]):
+        if inspect.iscoroutinefunction(self.chunk_func):
+            return await self.chunk_func(chunk)
+        if self.executor is not None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, self.chunk_func, chunk)
+        return await asyncio.to_thread(self.chunk_func, chunk)
+
+    async def _run_attempt(self, index: int, chunk: List[Any], attempt: int, progress: dict) -> Optional[str]:
+        """Run one attempt of a chunk. Returns None on success, or the error."""
+        start_time = datetime.now()
+        context = {
+            "job_name": self.name,
+            "chunk_index": index,
+            "chunk_size": len(chunk),
+            "attempt": attempt,
+            "start_time": start_time,
+        }
+        error = None
+        try:
+            result = await self._call_chunk(chunk)
+        except Exception as e:
+            error = str(e)
+            final = attempt > self.max_retries
+            if final:
+                progress["failed_chunks"] += 1
+            else:
+                progress["retries"] += 1
+            print(f"[Error][{self.name}][chunk {index}] attempt {attempt}: {e}")
+            context.update({
+                "success": False,
+                "error": error,
+                "will_retry": not final,
+            })
+        else:
+            progress["completed_chunks"] += 1
+            context.update({"success": True, "result": result})
+
+        end_time = datetime.now()
+        context.update({
+            "end_time": end_time,
+            "duration": (end_time - start_time).total_seconds(),
+            "progress": dict(progress),
+        })
+        for hook in self.on_chunk_hooks:
+            await execute_hook(hook, self.name, context)
+        return error
+
+    async def run_map(self):
+        """
+        Partition the work and process every chunk, retrying failed ones.
+        Returns a progress summary; per-chunk results go to the chunk hooks.
+        """
+        run = _MapRun(self, await self._get_partition())
+        # Each run counts into its own dict, so overlapping runs don't mix their counters.
+        # self.progress only points at the latest run for display.
+        self.progress = run.progress
+        await asyncio.gather(*(run.worker() for _ in range(self.max_concurrency)))
+
+        if run.failed:
+            raise RuntimeError(
+                f"{len(run.failed)} of {run.progress['total_chunks']} chunks failed: "
+                + "; ".join(f"chunk {i}: {error}" for i, error in sorted(run.failed.items()))
+            )
+        return dict(run.progress)
+
+# A chunk of work: (chunk index, items, attempt number)
+_Work = Tuple[int, List[Any], int]
+
+class _MapRun:
+    """State of a single MapCronJob run, shared by its workers."""
+
+    def __init__(self, job: MapCronJob, items: Iterator[Any]):
+        self.job = job
+        self.items = items
+        self.exhausted = False
+        # Serializes reads from the partition iterator, which may be a generator
+        self.read_lock = asyncio.Lock()
+        # Failed chunks whose retry delay is over, and the number still waiting
+        self.ready: deque = deque()
+        self.delayed = 0
+        self.changed = asyncio.Condition()
+        self.retry_tasks = set()
+        self.failed = {}
+        self.progress = {
+            "total_items": 0,
+            "total_chunks": 0,
+            "completed_chunks": 0,
+            "failed_chunks": 0,
+            "retries": 0,
+        }
+
+    async def _read_chunk(self) -> Optional[_Work]:
+        async with self.read_lock:
+            if self.exhausted:
+                return None
+            chunk = await asyncio.to_thread(lambda: list(islice(self.items, self.job.chunk_size)))
+            if not chunk:
+                self.exhausted = True
+                return None
+            index = self.progress["total_chunks"]
+            self.progress["total_chunks"] += 1
+            self.progress["total_items"] += len(chunk)
+            return index, chunk, 1
+
+    async def _next_work(self) -> Optional[_Work]:
+        while True:
+            if self.ready:
+                return self.ready.popleft()
+            work = await self._read_chunk()
+            if work is not None:
+                return work
+            # Partition exhausted: wait for delayed retries, if any
+            async with self.changed:
+                await self.changed.wait_for(lambda: self.ready or not self.delayed)
+                if not self.ready:
+                    return None
+
+    async def _retry_later(self, work: _Work):
+        await asyncio.sleep(self.job.retry_delay)
+        async with self.changed:
+            self.ready.append(work)
+            self.delayed -= 1
+            self.changed.notify_all()
+
+    async def worker(self):
+        while True:
+            work = await self._next_work()
+            if work is None:
+                return
+            index, chunk, attempt = work
+            error = await self.job._run_attempt(index, chunk, attempt, self.progress)
+            if error is None:
+                continue
+            if attempt > self.job.max_retries:
+                self.failed[index] = error
+                continue
+            self.delayed += 1
+            task = asyncio.create_task(self._retry_later((index, chunk, attempt + 1)))
+            self.retry_tasks.add(task)
+            task.add_done_callback(self.retry_tasks.discard)
+
+def map_cron_job(expr: str, *, partition: PartitionFunc, name=None, tags=None, **options):
+    """Decorator for creating a map cron job that processes partitioned work in chunks."""
+    from .scheduler import Crons
+
+    def wrapper(func: Callable):
+        # Get or create the global Crons instance
+        crons = Crons()
+        crons.register_job(MapCronJob(func, expr, partition, name=name, tags=tags, **options))
+        return func
+
+    return wrapper
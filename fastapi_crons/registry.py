@@ -0,0 +1,64 @@
+import asyncio
+from typing import Callable, Dict, List, Optional
+from .job import CronJob
+
+class JobRegistry:
+    """
+    Index of the scheduler's jobs, shared by every Crons instance.
+
+    Jobs are looked up by name and by tag in constant time. The registry also
+    keeps the scheduling task of each job, so a single job can be started or
+    stopped without touching the others.
+    """
+
+    def __init__(self):
+        self.jobs: Dict[str, CronJob] = {}
+        self.tags: Dict[str, Dict[str, CronJob]] = {}
+        # Callables that can be scheduled at runtime by name (e.g. from the REST API)
+        self.funcs: Dict[str, Callable] = {}
+        self.tasks: Dict[str, asyncio.Task] = {}
+        # Event loop the scheduler runs on, None while the app is not running
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def add(self, job: CronJob):
+        """Index a job. Raises ValueError if a job with the same name exists."""
+        if job.name in self.jobs:
+            raise ValueError(f"Job '{job.name}' already exists")
+        self.jobs[job.name] = job
+        for tag in job.tags:
+            self.tags.setdefault(tag, {})[job.name] = job
+
+    def remove(self, name: str) -> Optional[CronJob]:
+        """Remove a job from the index and return it, or None if it does not exist."""
+        job = self.jobs.pop(name, None)
+        if job is None:
+            return None
+        for tag in job.tags:
+            tagged = self.tags.get(tag)
+            if tagged is not None:
+                tagged.pop(name, None)
+                if not tagged:
+                    del self.tags[tag]
+        return job
+
+    def add_func(self, name: str, func: Callable):
+        """
+        Register a callable for runtime scheduling. Raises ValueError if the
+        name is already bound to a different callable.
+        """
+        existing = self.funcs.get(name)
+        if existing is not None and existing is not func:
+            raise ValueError(
+                f"Function name '{name}' is already registered for "
+                f"{existing.__module__}.{existing.__qualname__}"
+            )
+        self.funcs[name] = func
+
+    def get(self, name: str) -> Optional[CronJob]:
+        return self.jobs.get(name)
+
+    def get_by_tag(self, tag: str) -> List[CronJob]:
+        return list(self.tags.get(tag, {}).values())
+
+    def all(self) -> List[CronJob]:
+        return list(self.jobs.values())
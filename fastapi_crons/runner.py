@@ -14,11 +14,26 @@ async def execute_hook(hook: HookFunc, job_name: str, context: dict):
     except Exception as e:
         print(f"[Error][Hook][{job_name}] {e}")
 
+async def wait_for_change(job: CronJob, timeout=None) -> bool:
+    """Wait until the job is changed (paused, resumed, rescheduled, stopped) or the timeout expires."""
+    try:
+        await asyncio.wait_for(job._changed.wait(), timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
 async def run_job_loop(job: CronJob, state: SQLiteStateBackend):
-    while True:
+    while not job.removed:
+        job._changed.clear()
+        if job.paused:
+            await wait_for_change(job)
+            continue
+
         now = datetime.now()
         seconds = (job.next_run - now).total_seconds()
-        await asyncio.sleep(max(0, seconds))
+        if await wait_for_change(job, max(0, seconds)):
+            # Schedule changed while sleeping, recompute
+            continue
 
         # Create context for hooks
         context = {
@@ -74,4 +89,7 @@ async def run_job_loop(job: CronJob, state: SQLiteStateBackend):
             for hook in job.on_error_hooks:
                 await execute_hook(hook, job.name, context)
 
-        job.update_next_run()
+        # If the job was rescheduled or resumed during the run, next_run already
+        # points at the first slot of the new schedule
+        if not job._changed.is_set():
+            job.update_next_run()
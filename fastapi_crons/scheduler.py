@@ -1,6 +1,8 @@
 import asyncio
-from typing import Callable, List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any, Tuple
 from .job import CronJob, HookFunc
+from .map_job import MapCronJob, PartitionFunc
+from .registry import JobRegistry
 from .state import SQLiteStateBackend
 from .runner import run_job_loop
 
@@ -12,7 +14,7 @@ class Crons:
     
         # If this is the first instance, initialize it
         if _instance is None:
-            self.jobs: List[CronJob] = []
+            self.registry = JobRegistry()
             self.state_backend = state_backend or SQLiteStateBackend()
             self.app = app
             if app:
@@ -20,7 +22,7 @@ class Crons:
             _instance = self
         # If an instance already exists, use its data
         else:
-            self.jobs = _instance.jobs
+            self.registry = _instance.registry
             self.state_backend = state_backend or _instance.state_backend
             self.app = app or _instance.app
             if app and app != _instance.app:
@@ -29,25 +31,175 @@ class Crons:
     def init_app(self, app):
         @app.on_event("startup")
         async def startup():
-            for job in self.jobs:
-                asyncio.create_task(run_job_loop(job, self.state_backend))
+            await self.apply_overrides()
+            self.registry.loop = asyncio.get_running_loop()
+            for job in self.registry.all():
+                # Overrides were just applied to all jobs at once
+                self._start_job(job, apply_override=False)
+
+        @app.on_event("shutdown")
+        async def shutdown():
+            self.registry.loop = None
+            for task in self.registry.tasks.values():
+                task.cancel()
+            self.registry.tasks.clear()
+
+    @property
+    def jobs(self) -> Tuple[CronJob, ...]:
+        """
+        Read-only snapshot of the registered jobs. Use add_job/register_job
+        and remove_job to change them.
+        """
+        return tuple(self.registry.all())
+
+    async def _run_job(self, job: CronJob, apply_override: bool):
+        if apply_override:
+            override = await self.state_backend.get_overrides(job.name)
+            if override:
+                self._apply_override(job, override)
+        await run_job_loop(job, self.state_backend)
+
+    def _create_task(self, job: CronJob, apply_override: bool):
+        task = self.registry.tasks.get(job.name)
+        if task is not None and not task.done():
+            return
+        # The Event binds to the loop that first waits on it, so each loop gets a new one
+        job._changed = asyncio.Event()
+        self.registry.tasks[job.name] = asyncio.create_task(self._run_job(job, apply_override))
+
+    def _start_job(self, job: CronJob, apply_override: bool = True):
+        loop = self.registry.loop
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._create_task(job, apply_override)
+        else:
+            # Called from another thread, e.g. a sync endpoint running in the threadpool
+            loop.call_soon_threadsafe(self._create_task, job, apply_override)
+
+    def _apply_override(self, job: CronJob, override: dict):
+        if override["expr"]:
+            job.reschedule(override["expr"])
+        if override["paused"]:
+            job.pause()
+
+    async def apply_overrides(self):
+        """Apply the pause state and schedule overrides saved in the state backend."""
+        overrides = await self.state_backend.get_all_overrides()
+        for name, override in overrides.items():
+            job = self.get_job(name)
+            if job is not None:
+                self._apply_override(job, override)
+
+    def register_job(self, job: CronJob) -> CronJob:
+        """
+        Add a job to the scheduler. If the scheduler is already running,
+        the job starts right away, after its saved overrides are applied.
+        Raises ValueError if a job with the same name exists.
+        """
+        self.registry.add(job)
+        if self.registry.loop is not None:
+            try:
+                self._start_job(job)
+            except Exception:
+                self.registry.remove(job.name)
+                raise
+        return job
+
+    def add_job(self, func: Callable, expr: str, *, name=None, tags=None) -> CronJob:
+        """
+        Create a job for func and add it to the scheduler. func is also
+        registered by its function name so it can be scheduled again at runtime.
+        Raises ValueError if that name is registered for a different function.
+        """
+        job = CronJob(func, expr, name=name, tags=tags)
+        self.registry.add_func(func.__name__, func)
+        return self.register_job(job)
 
     def cron(self, expr: str, *, name=None, tags=None):
         def wrapper(func: Callable):
-            job = CronJob(func, expr, name=name, tags=tags)
-            self.jobs.append(job)
+            self.add_job(func, expr, name=name, tags=tags)
+            return func
+        return wrapper
+
+    def task(self, name=None):
+        """
+        Register a function that can be scheduled at runtime by name,
+        e.g. through the REST API, without scheduling it now.
+        Raises ValueError if the name is registered for a different function.
+        """
+        def wrapper(func: Callable):
+            self.registry.add_func(name or func.__name__, func)
+            return func
+        return wrapper
+
+    def map_cron(self, expr: str, *, partition: PartitionFunc, name=None, tags=None, **options):
+        """
+        Register a map job: `partition` produces the work items and the
+        decorated function is called once per chunk of items.
+        Extra options (chunk_size, max_concurrency, executor, max_retries,
+        retry_delay) are passed to MapCronJob.
+        """
+        def wrapper(func: Callable):
+            self.register_job(MapCronJob(func, expr, partition, name=name, tags=tags, **options))
             return func
         return wrapper
 
+    async def remove_job(self, name: str) -> bool:
+        """
+        Remove a job and delete its saved overrides. A run in progress finishes
+        (with its hooks) before the job's loop stops.
+        """
+        job = self.registry.remove(name)
+        if job is None:
+            return False
+        self.registry.tasks.pop(name, None)
+        job.stop()
+        await self.state_backend.delete_overrides(name)
+        return True
+
+    async def pause_job(self, name: str) -> bool:
+        """Pause a job. The pause is saved and survives restarts."""
+        job = self.get_job(name)
+        if job is None:
+            return False
+        job.pause()
+        await self.state_backend.set_paused(name, True)
+        return True
+
+    async def resume_job(self, name: str) -> bool:
+        """Resume a paused job."""
+        job = self.get_job(name)
+        if job is None:
+            return False
+        job.resume()
+        await self.state_backend.set_paused(name, False)
+        return True
+
+    async def reschedule_job(self, name: str, expr: str) -> bool:
+        """
+        Change the cron expression of a job. The new schedule is saved and
+        survives restarts. Raises ValueError if expr is not a valid cron expression.
+        """
+        job = self.get_job(name)
+        if job is None:
+            return False
+        job.reschedule(expr)
+        await self.state_backend.set_expr(name, expr)
+        return True
+
     def get_jobs(self):
         return self.jobs
         
     def get_job(self, name: str) -> Optional[CronJob]:
         """Get a job by name."""
-        for job in self.jobs:
-            if job.name == name:
-                return job
-        return None
+        return self.registry.get(name)
+
+    def get_jobs_by_tag(self, tag: str) -> List[CronJob]:
+        """Get all jobs with the given tag."""
+        return self.registry.get_by_tag(tag)
         
     def add_before_run_hook(self, hook: HookFunc, job_name: Optional[str] = None):
         """
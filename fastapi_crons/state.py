@@ -35,3 +35,54 @@ class SQLiteStateBackend:
             """)
             async with db.execute("SELECT name, last_run FROM job_state") as cursor:
                 return await cursor.fetchall()
+
+    async def _create_overrides_table(self, db):
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS job_overrides (
+                name TEXT PRIMARY KEY,
+                paused INTEGER NOT NULL DEFAULT 0,
+                expr TEXT
+            )
+        """)
+
+    async def set_paused(self, job_name: str, paused: bool):
+        async with aiosqlite.connect(self.db_path) as db:
+            await self._create_overrides_table(db)
+            await db.execute(
+                """INSERT INTO job_overrides (name, paused) VALUES (?, ?)
+                   ON CONFLICT(name) DO UPDATE SET paused=excluded.paused""",
+                (job_name, int(paused))
+            )
+            await db.commit()
+
+    async def set_expr(self, job_name: str, expr: str):
+        async with aiosqlite.connect(self.db_path) as db:
+            await self._create_overrides_table(db)
+            await db.execute(
+                """INSERT INTO job_overrides (name, expr) VALUES (?, ?)
+                   ON CONFLICT(name) DO UPDATE SET expr=excluded.expr""",
+                (job_name, expr)
+            )
+            await db.commit()
+
+    async def delete_overrides(self, job_name: str):
+        async with aiosqlite.connect(self.db_path) as db:
+            await self._create_overrides_table(db)
+            await db.execute("DELETE FROM job_overrides WHERE name=?", (job_name,))
+            await db.commit()
+
+    async def get_overrides(self, job_name: str):
+        """Return {"paused": bool, "expr": str or None} for a job, or None if it has no overrides."""
+        async with aiosqlite.connect(self.db_path) as db:
+            await self._create_overrides_table(db)
+            async with db.execute("SELECT paused, expr FROM job_overrides WHERE name=?", (job_name,)) as cursor:
+                row = await cursor.fetchone()
+                return {"paused": bool(row[0]), "expr": row[1]} if row else None
+
+    async def get_all_overrides(self):
+        """Return {job_name: {"paused": bool, "expr": str or None}} for every job with overrides."""
+        async with aiosqlite.connect(self.db_path) as db:
+            await self._create_overrides_table(db)
+            async with db.execute("SELECT name, paused, expr FROM job_overrides") as cursor:
+                rows = await cursor.fetchall()
+                return {name: {"paused": bool(paused), "expr": expr} for name, paused, expr in rows}
@@ -0,0 +1,17 @@
+import asyncio
+import pytest
+from fastapi_crons import endpoints, scheduler
+from fastapi_crons.state import SQLiteStateBackend
+
+@pytest.fixture(autouse=True)
+def reset_crons(monkeypatch):
+    # Crons is a process-wide singleton; give every test a fresh one
+    monkeypatch.setattr(scheduler, "_instance", None)
+    monkeypatch.setattr(endpoints, "_crons", None)
+
+@pytest.fixture
+def state_backend(tmp_path):
+    backend = SQLiteStateBackend(db_path=str(tmp_path / "cron_state.db"))
+    # Create the job_state table, which get_last_run expects to exist
+    asyncio.run(backend.get_all_jobs())
+    return backend
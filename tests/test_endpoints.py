@@ -0,0 +1,120 @@
+import time
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_crons import Crons, get_cron_router, scheduler
+
+def nightly():
+    pass
+
+def extra():
+    pass
+
+@pytest.fixture
+def make_app(state_backend):
+    def make_app():
+        app = FastAPI()
+        crons = Crons(app, state_backend=state_backend)
+        app.include_router(get_cron_router())
+        crons.add_job(nightly, "0 0 * * *", name="nightly", tags=["maintenance"])
+        crons.add_job(extra, "0 1 * * *", name="other")
+        return app
+    return make_app
+
+@pytest.fixture
+def app(make_app):
+    return make_app()
+
+def jobs_by_name(client, **params):
+    return {job["name"]: job for job in client.get("/crons", params=params).json()}
+
+def test_add_and_remove_job(app):
+    with TestClient(app) as client:
+        response = client.post("/crons", json={"name": "added", "expr": "0 2 * * *", "func": "extra", "tags": ["new"]})
+        assert response.json() == {"status": "success", "message": "Job 'added' added"}
+        assert set(jobs_by_name(client, tag="new")) == {"added"}
+
+        response = client.delete("/crons/added")
+        assert response.json() == {"status": "success", "message": "Job 'added' removed"}
+        assert "added" not in jobs_by_name(client)
+
+def test_add_job_errors(app):
+    with TestClient(app) as client:
+        response = client.post("/crons", json={"name": "nightly", "expr": "0 2 * * *", "func": "extra"})
+        assert response.json() == {"status": "error", "message": "Job 'nightly' already exists"}
+
+        response = client.post("/crons", json={"name": "x", "expr": "0 2 * * *", "func": "missing"})
+        assert response.json() == {"status": "error", "message": "Function 'missing' is not registered"}
+
+        response = client.post("/crons", json={"name": "x", "expr": "not a cron", "func": "extra"})
+        assert response.json()["status"] == "error"
+        assert "x" not in jobs_by_name(client)
+
+def test_unknown_job_errors(app):
+    with TestClient(app) as client:
+        not_found = {"status": "error", "message": "Job 'missing' not found"}
+        assert client.delete("/crons/missing").json() == not_found
+        assert client.post("/crons/missing/pause").json() == not_found
+        assert client.post("/crons/missing/resume").json() == not_found
+        assert client.put("/crons/missing/schedule", json={"expr": "0 * * * *"}).json() == not_found
+
+def test_pause_resume_and_reschedule(app):
+    with TestClient(app) as client:
+        assert client.post("/crons/nightly/pause").json()["status"] == "success"
+        assert jobs_by_name(client)["nightly"]["paused"] is True
+        assert jobs_by_name(client)["other"]["paused"] is False
+
+        assert client.post("/crons/nightly/resume").json()["status"] == "success"
+        assert jobs_by_name(client)["nightly"]["paused"] is False
+
+        response = client.put("/crons/nightly/schedule", json={"expr": "30 3 * * *"})
+        assert response.json() == {"status": "success", "message": "Job 'nightly' rescheduled to '30 3 * * *'"}
+        assert jobs_by_name(client)["nightly"]["expr"] == "30 3 * * *"
+
+        response = client.put("/crons/nightly/schedule", json={"expr": "bad"})
+        assert response.json()["status"] == "error"
+        assert jobs_by_name(client)["nightly"]["expr"] == "30 3 * * *"
+
+def test_list_jobs_by_tag(app):
+    with TestClient(app) as client:
+        assert set(jobs_by_name(client, tag="maintenance")) == {"nightly"}
+        assert jobs_by_name(client, tag="missing") == {}
+        assert set(jobs_by_name(client)) == {"nightly", "other"}
+
+def test_overrides_survive_restart(app, make_app, monkeypatch):
+    with TestClient(app) as client:
+        client.post("/crons/nightly/pause")
+        client.put("/crons/other/schedule", json={"expr": "15 2 * * *"})
+
+    # Simulate a restart: a fresh scheduler with the jobs declared in code
+    monkeypatch.setattr(scheduler, "_instance", None)
+    with TestClient(make_app()) as client:
+        jobs = jobs_by_name(client)
+        assert jobs["nightly"]["paused"] is True
+        assert jobs["other"]["expr"] == "15 2 * * *"
+        assert jobs["other"]["paused"] is False
+
+def test_override_applied_to_job_re_added_after_restart(app, make_app, monkeypatch):
+    with TestClient(app) as client:
+        client.post("/crons", json={"name": "added", "expr": "0 2 * * *", "func": "extra"})
+        client.post("/crons/added/pause")
+
+    monkeypatch.setattr(scheduler, "_instance", None)
+    with TestClient(make_app()) as client:
+        assert "added" not in jobs_by_name(client)
+        client.post("/crons", json={"name": "added", "expr": "0 2 * * *", "func": "extra"})
+        # The override is read by the job's task before its first run
+        for _ in range(50):
+            if jobs_by_name(client)["added"]["paused"]:
+                break
+            time.sleep(0.02)
+        assert jobs_by_name(client)["added"]["paused"] is True
+
+def test_restart_restarts_job_tasks(app):
+    from fastapi_crons import endpoints
+
+    for _ in range(2):
+        with TestClient(app):
+            tasks = endpoints._crons.registry.tasks
+            assert set(tasks) == {"nightly", "other"}
+            assert not any(task.done() for task in tasks.values())
@@ -0,0 +1,169 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from fastapi_crons.map_job import MapCronJob
+
+def make_job(chunk_func, items, **options):
+    return MapCronJob(chunk_func, "* * * * *", lambda: items, **options)
+
+def test_chunks_split_with_short_final_chunk():
+    chunks = []
+
+    async def work(chunk):
+        chunks.append(chunk)
+
+    job = make_job(work, range(7), chunk_size=3, max_concurrency=1)
+    progress = asyncio.run(job.func())
+
+    assert chunks == [[0, 1, 2], [3, 4, 5], [6]]
+    assert progress == {
+        "total_items": 7,
+        "total_chunks": 3,
+        "completed_chunks": 3,
+        "failed_chunks": 0,
+        "retries": 0,
+    }
+
+def test_empty_partition_runs_no_chunks():
+    chunks = []
+    job = make_job(chunks.append, [], chunk_size=3)
+
+    progress = asyncio.run(job.func())
+
+    assert chunks == []
+    assert progress["total_chunks"] == 0
+    assert progress["completed_chunks"] == 0
+
+def test_generator_partition_is_consumed_lazily():
+    read = []
+
+    def partition():
+        for i in range(6):
+            read.append(i)
+            yield i
+
+    seen_when_called = []
+
+    async def work(chunk):
+        seen_when_called.append(len(read))
+
+    job = MapCronJob(work, "* * * * *", partition, chunk_size=2, max_concurrency=1)
+    asyncio.run(job.func())
+
+    # Items are read one chunk at a time, not all up front
+    assert seen_when_called == [2, 4, 6]
+
+def test_max_concurrency_is_never_exceeded():
+    active = 0
+    peak = 0
+
+    async def work(chunk):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    job = make_job(work, range(40), chunk_size=2, max_concurrency=3)
+    asyncio.run(job.func())
+
+    assert peak == 3
+
+def test_failing_chunk_is_retried_alone():
+    calls = {}
+
+    async def work(chunk):
+        calls[chunk[0]] = calls.get(chunk[0], 0) + 1
+        if chunk[0] == 2 and calls[2] < 3:
+            raise ValueError("flaky")
+
+    job = make_job(work, range(6), chunk_size=2, max_retries=2)
+    progress = asyncio.run(job.func())
+
+    assert calls == {0: 1, 2: 3, 4: 1}
+    assert progress["completed_chunks"] == 3
+    assert progress["retries"] == 2
+    assert progress["failed_chunks"] == 0
+
+def test_exhausted_retries_raise_aggregated_error():
+    calls = {}
+
+    async def work(chunk):
+        calls[chunk[0]] = calls.get(chunk[0], 0) + 1
+        if chunk[0] in (0, 4):
+            raise ValueError(f"bad {chunk[0]}")
+
+    job = make_job(work, range(6), chunk_size=2, max_retries=1)
+    with pytest.raises(RuntimeError) as exc_info:
+        asyncio.run(job.func())
+
+    assert str(exc_info.value) == "2 of 3 chunks failed: chunk 0: bad 0; chunk 2: bad 4"
+    assert calls == {0: 2, 2: 1, 4: 2}
+    assert job.progress == {
+        "total_items": 6,
+        "total_chunks": 3,
+        "completed_chunks": 1,
+        "failed_chunks": 2,
+        "retries": 2,
+    }
+
+def test_retry_delay_does_not_block_other_chunks():
+    order = []
+
+    async def work(chunk):
+        order.append(chunk[0])
+        if chunk[0] == 0 and order.count(0) == 1:
+            raise ValueError("flaky")
+
+    job = make_job(work, range(3), chunk_size=1, max_concurrency=1, max_retries=1, retry_delay=0.05)
+    asyncio.run(job.func())
+
+    assert order == [0, 1, 2, 0]
+
+def test_sync_chunks_run_in_supplied_executor():
+    threads = set()
+
+    def work(chunk):
+        threads.add(threading.current_thread().name)
+
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="map-test") as executor:
+        job = make_job(work, range(6), chunk_size=2, executor=executor)
+        asyncio.run(job.func())
+
+    assert threads and all(name.startswith("map-test") for name in threads)
+
+def test_chunk_hook_context():
+    contexts = []
+
+    async def work(chunk):
+        if chunk[0] == 0 and not contexts:
+            raise ValueError("flaky")
+        return sum(chunk)
+
+    job = make_job(work, range(4), chunk_size=2, max_concurrency=1, max_retries=1)
+    job.add_on_chunk_hook(lambda name, context: contexts.append(context))
+    asyncio.run(job.func())
+
+    by_attempt = {(c["chunk_index"], c["attempt"]): c for c in contexts}
+    failed, retried, second = by_attempt[(0, 1)], by_attempt[(0, 2)], by_attempt[(1, 1)]
+    assert len(contexts) == 3
+    assert failed["success"] is False
+    assert failed["will_retry"] is True
+    assert failed["error"] == "flaky"
+    assert failed["progress"]["retries"] == 1
+    assert second["success"] is True
+    assert retried["success"] is True
+    assert "will_retry" not in retried
+    assert retried["result"] == 1
+    assert contexts[-1]["progress"]["completed_chunks"] == 2
+
+@pytest.mark.parametrize("option, value", [
+    ("chunk_size", 0),
+    ("max_concurrency", 0),
+    ("max_retries", -1),
+    ("retry_delay", -1),
+])
+def test_constructor_validation(option, value):
+    with pytest.raises(ValueError):
+        make_job(lambda chunk: None, [], **{option: value})
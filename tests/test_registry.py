@@ -0,0 +1,55 @@
+import pytest
+from fastapi_crons.job import CronJob
+from fastapi_crons.registry import JobRegistry
+
+def noop():
+    pass
+
+def other():
+    pass
+
+def test_add_and_lookup_by_name_and_tag():
+    registry = JobRegistry()
+    a = CronJob(noop, "* * * * *", name="a", tags=["x", "y"])
+    b = CronJob(noop, "* * * * *", name="b", tags=["x"])
+    registry.add(a)
+    registry.add(b)
+
+    assert registry.get("a") is a
+    assert registry.get("missing") is None
+    assert registry.get_by_tag("x") == [a, b]
+    assert registry.get_by_tag("y") == [a]
+    assert registry.get_by_tag("missing") == []
+    assert registry.all() == [a, b]
+
+def test_duplicate_name_raises():
+    registry = JobRegistry()
+    registry.add(CronJob(noop, "* * * * *", name="a"))
+
+    with pytest.raises(ValueError, match="already exists"):
+        registry.add(CronJob(noop, "0 * * * *", name="a"))
+
+def test_remove_drops_empty_tag_buckets():
+    registry = JobRegistry()
+    a = CronJob(noop, "* * * * *", name="a", tags=["x", "y"])
+    b = CronJob(noop, "* * * * *", name="b", tags=["x"])
+    registry.add(a)
+    registry.add(b)
+
+    assert registry.remove("a") is a
+    assert registry.remove("a") is None
+    assert registry.get("a") is None
+    assert registry.get_by_tag("x") == [b]
+    assert "y" not in registry.tags
+
+    registry.remove("b")
+    assert registry.tags == {}
+
+def test_add_func_rejects_a_different_callable_under_the_same_name():
+    registry = JobRegistry()
+    registry.add_func("noop", noop)
+    registry.add_func("noop", noop)
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.add_func("noop", other)
+    assert registry.funcs["noop"] is noop
@@ -0,0 +1,57 @@
+import asyncio
+from datetime import datetime, timedelta
+from fastapi_crons.job import CronJob
+from fastapi_crons.runner import run_job_loop
+
+class MemoryStateBackend:
+    async def set_last_run(self, job_name: str, timestamp: datetime):
+        pass
+
+def test_reschedule_during_run_keeps_first_slot_of_new_schedule():
+    async def main():
+        started = asyncio.Event()
+        runs = []
+
+        async def func():
+            runs.append(datetime.now())
+            started.set()
+            await asyncio.sleep(0.5)
+
+        job = CronJob(func, "0 0 1 1 *")
+        job._changed = asyncio.Event()
+        job.next_run = datetime.now() + timedelta(seconds=0.1)
+        task = asyncio.create_task(run_job_loop(job, MemoryStateBackend()))
+
+        await started.wait()
+        job.reschedule("* * * * * */2")
+        expected = job.next_run
+        while len(runs) < 2:
+            await asyncio.sleep(0.05)
+        task.cancel()
+
+        # The second run happens at the first slot of the new schedule, not one later
+        assert abs((runs[1] - expected).total_seconds()) < 0.5
+
+    asyncio.run(main())
+
+def test_stop_during_run_lets_run_finish():
+    async def main():
+        started = asyncio.Event()
+        finished = []
+
+        async def func():
+            started.set()
+            await asyncio.sleep(0.2)
+
+        job = CronJob(func, "* * * * * *")
+        job._changed = asyncio.Event()
+        job.add_after_run_hook(lambda name, context: finished.append(name))
+        task = asyncio.create_task(run_job_loop(job, MemoryStateBackend()))
+
+        await started.wait()
+        job.stop()
+        await asyncio.wait_for(task, 2)
+
+        assert finished == [job.name]
+
+    asyncio.run(main())
@@ -0,0 +1,122 @@
+import asyncio
+import pytest
+from fastapi_crons import Crons
+from fastapi_crons.job import CronJob
+
+def noop():
+    pass
+
+async def wait_for_task(crons, name):
+    for _ in range(100):
+        if name in crons.registry.tasks:
+            return crons.registry.tasks[name]
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"no task started for '{name}'")
+
+def stop_tasks(crons):
+    for task in crons.registry.tasks.values():
+        task.cancel()
+    crons.registry.tasks.clear()
+    crons.registry.loop = None
+
+def test_apply_overrides_restores_pause_and_expr(state_backend):
+    crons = Crons(state_backend=state_backend)
+    paused = crons.add_job(noop, "* * * * *", name="paused")
+    rescheduled = crons.add_job(noop, "* * * * *", name="rescheduled")
+
+    async def main():
+        await state_backend.set_paused("paused", True)
+        await state_backend.set_expr("rescheduled", "0 4 * * *")
+        await state_backend.set_expr("unknown", "0 4 * * *")
+        await crons.apply_overrides()
+
+    asyncio.run(main())
+
+    assert paused.paused is True
+    assert paused.expr == "* * * * *"
+    assert rescheduled.paused is False
+    assert rescheduled.expr == "0 4 * * *"
+    assert (rescheduled.next_run.hour, rescheduled.next_run.minute) == (4, 0)
+
+def test_register_job_after_startup_starts_task_with_saved_override(state_backend):
+    crons = Crons(state_backend=state_backend)
+
+    async def main():
+        await state_backend.set_paused("late", True)
+        crons.registry.loop = asyncio.get_running_loop()
+        try:
+            job = crons.add_job(noop, "* * * * *", name="late")
+            task = await wait_for_task(crons, "late")
+            await asyncio.sleep(0.1)
+            assert not task.done()
+            assert job.paused is True
+        finally:
+            stop_tasks(crons)
+
+    asyncio.run(main())
+
+def test_register_job_from_another_thread(state_backend):
+    crons = Crons(state_backend=state_backend)
+
+    async def main():
+        crons.registry.loop = asyncio.get_running_loop()
+        try:
+            await asyncio.to_thread(crons.add_job, noop, "* * * * *", name="threaded")
+            task = await wait_for_task(crons, "threaded")
+            assert not task.done()
+        finally:
+            stop_tasks(crons)
+
+    asyncio.run(main())
+
+def test_register_job_rolls_back_when_start_fails(state_backend):
+    crons = Crons(state_backend=state_backend)
+    closed_loop = asyncio.new_event_loop()
+    closed_loop.close()
+    crons.registry.loop = closed_loop
+
+    with pytest.raises(RuntimeError):
+        crons.add_job(noop, "* * * * *", name="late")
+
+    assert crons.get_job("late") is None
+    crons.registry.loop = None
+    assert crons.add_job(noop, "* * * * *", name="late").name == "late"
+
+def test_duplicate_job_names_raise(state_backend):
+    crons = Crons(state_backend=state_backend)
+    crons.cron("0 * * * *")(noop)
+
+    with pytest.raises(ValueError, match="already exists"):
+        crons.cron("30 * * * *")(noop)
+    crons.cron("30 * * * *", name="noop_half_past")(noop)
+    assert [job.name for job in crons.get_jobs()] == ["noop", "noop_half_past"]
+
+def test_function_names_must_be_unique():
+    crons = Crons()
+    namespace = {}
+    exec("def noop():\n    pass", namespace)
+
+    crons.cron("0 * * * *")(noop)
+    with pytest.raises(ValueError, match="already registered"):
+        crons.cron("0 * * * *", name="other")(namespace["noop"])
+    with pytest.raises(ValueError, match="already registered"):
+        crons.task()(namespace["noop"])
+    assert crons.get_job("other") is None
+
+    crons.task(name="other_noop")(namespace["noop"])
+    assert crons.registry.funcs == {"noop": noop, "other_noop": namespace["noop"]}
+
+def test_jobs_is_read_only():
+    crons = Crons()
+    crons.add_job(noop, "* * * * *")
+
+    assert isinstance(crons.jobs, tuple)
+    with pytest.raises(AttributeError):
+        crons.jobs.append(CronJob(noop, "* * * * *", name="other"))
+
+def test_get_jobs_by_tag():
+    crons = Crons()
+    a = crons.add_job(noop, "* * * * *", name="a", tags=["x"])
+    crons.add_job(noop, "* * * * *", name="b", tags=["y"])
+
+    assert crons.get_jobs_by_tag("x") == [a]
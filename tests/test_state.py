@@ -0,0 +1,27 @@
+import asyncio
+from fastapi_crons.state import SQLiteStateBackend
+
+def test_overrides_round_trip(tmp_path):
+    async def main():
+        backend = SQLiteStateBackend(db_path=str(tmp_path / "cron_state.db"))
+        assert await backend.get_all_overrides() == {}
+        assert await backend.get_overrides("a") is None
+
+        await backend.set_paused("a", True)
+        await backend.set_expr("a", "0 * * * *")
+        await backend.set_expr("b", "*/5 * * * *")
+        assert await backend.get_overrides("a") == {"paused": True, "expr": "0 * * * *"}
+        assert await backend.get_all_overrides() == {
+            "a": {"paused": True, "expr": "0 * * * *"},
+            "b": {"paused": False, "expr": "*/5 * * * *"},
+        }
+
+        # Updating one column keeps the other
+        await backend.set_paused("a", False)
+        assert await backend.get_overrides("a") == {"paused": False, "expr": "0 * * * *"}
+
+        await backend.delete_overrides("a")
+        assert await backend.get_overrides("a") is None
+        assert list(await backend.get_all_overrides()) == ["b"]
+
+    asyncio.run(main())